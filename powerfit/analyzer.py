@@ -1,11 +1,5 @@
-from __future__ import division
-from __future__ import absolute_import
-from six.moves import range
-
-
 from numpy import zeros, bool_, greater_equal, log
 from scipy.ndimage import label, maximum_position
-from six.moves import zip
 
 class Analyzer(object):
 
@@ -105,12 +99,16 @@ class Analyzer(object):
         if self._solutions is None:
             self._generate_solutions()
 
+        headers = '#rank cc Fish-z rel-z x y z a11 a12 a13 a21 a22 a23 a31 a32 a33'.split()
+        # printf-style formatting is noticeably cheaper per line than
+        # str.format for this many fixed-width fields
+        line = ' '.join(['%-6s'] + ['%6s'] * 3 + ['%8s'] * 3 + ['%6s'] * 9) + '\n'
+        lines = [line % tuple(headers)]
+        line = ' '.join(['%-6d'] + ['%6.3f'] * 3 + ['%8.3f'] * 3 + ['%6.3f'] * 9) + '\n'
+        for n, sol in enumerate(self._solutions, 1):
+            lines.append(line % (n, *sol))
+
         with open(out, 'w') as f:
-            headers = '#rank cc Fish-z rel-z x y z a11 a12 a13 a21 a22 a23 a31 a32 a33'.split()
-            line = ' '.join(['{:<6s}'] + ['{:>6s}'] * 3 + ['{:>8s}'] * 3 + ['{:>6s}'] * 9) + '\n'
-            f.write(line.format(*headers))
-            line = ' '.join(['{:<6d}'] + ['{:6.3f}'] * 3 + ['{:8.3f}'] * 3 + ['{:6.3f}'] * 9) + '\n'
-            for n, sol in enumerate(self._solutions):
-                f.write(line.format(n + 1, *sol))
+            f.write(''.join(lines))
             
 
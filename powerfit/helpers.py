@@ -1,5 +1,3 @@
-from __future__ import absolute_import, division
-
 from math import sqrt
 from scipy.spatial import cKDTree
 
@@ -163,8 +161,7 @@ def write_fits_to_pdb(
         out = translated_structure.duplicate()
         rot = np.asarray([float(x) for x in sol[6:]]).reshape(3, 3)
         trans = sol[3:6]
-        out.rotate(rot)
-        out.translate(np.array(trans))
+        out.affine(rot, trans)
         out.filename = basename + "_{:d}.pdb".format(n + 1)
         if xyz_fixed:
 
@@ -13,9 +13,6 @@
 
 # Your modified code follows...
 
-from __future__ import absolute_import, division
-from __future__ import print_function
-
 from os.path import splitext
 from pathlib import Path
 from time import time
@@ -8,7 +8,6 @@
 
 # Your modified code follows...
 
-from __future__ import absolute_import, division
 
 from sys import stdout
 from os import remove
@@ -21,7 +20,6 @@ from string import Template
 import numpy as np
 from numpy.fft import irfftn as np_irfftn, rfftn as np_rfftn
 from scipy.ndimage import laplace
-from six.moves import range
 
 try:
     from pyfftw import zeros_aligned, simd_alignment
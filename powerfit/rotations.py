@@ -1,11 +1,8 @@
-from __future__ import absolute_import, division
 import os.path
 from math import sqrt
 from random import random
 
 import numpy as np
-import six
-from six.moves import zip
 
 
 def euler(angle, axis):
@@ -115,7 +112,7 @@ def proportional_orientations(angle):
 
     # determine the apropiate set to use
     smallestdiff = None
-    for s, n in six.iteritems(rot_sets):
+    for s, n in rot_sets.items():
         alpha = n[1]
         diff = abs(angle - alpha)
         try:
@@ -1,5 +1,3 @@
-from __future__ import division, absolute_import
-from __future__ import print_function
 from argparse import ArgumentParser, FileType
 from os.path import splitext
 from pathlib import Path
@@ -1,5 +1,3 @@
-from __future__ import division, absolute_import
-
 import numpy as np
 import numpy.linalg as la
 
@@ -11,12 +11,12 @@
 
 # Your modified code follows...
 
-from __future__ import absolute_import
-from string import capwords
+import itertools
+from pathlib import Path
 import numpy as np
+import gemmi
 from .elements import ELEMENTS
 from struvolpy import Structure as svpStructure
-import TEMPy
 
 
 MODEL = 'MODEL '
@@ -37,20 +37,192 @@ ATOM_DATA = ('record id name alt resn chain resi i x y z q b ' \
         'e charge').split()
 TER_DATA = 'id resn chain resi i'.split()
 
+# Element properties used by Structure, keyed on upper case element symbol
+ELEMENT_PROPERTIES = ('number', 'mass', 'vdwrad')
+ELEMENT_TABLE = {
+    element.symbol.upper(): tuple(
+        float(getattr(element, ptype)) for ptype in ELEMENT_PROPERTIES
+        )
+    for element in ELEMENTS
+}
+
 
 
 class Structure(svpStructure):
     def __init__(self, filename, gemmi_structure):
         super().__init__(filename, gemmi_structure)
-    
+        self._reset_cache()
+        # (filename, resolved path) pair, so filepathway does not hit the
+        # filesystem on every access
+        self._filepathway_cache = None
+
+
+    @property
+    def structure(self):
+        return svpStructure.structure.fget(self)
+
+
+    @structure.setter
+    def structure(self, new_structure):
+        svpStructure.structure.fset(self, new_structure)
+        self._reset_cache()
+
+
+    @property
+    def filepathway(self):
+        """Return the absolute path of the file the structure was read from"""
+        filename = self.__filename
+        if self._filepathway_cache is None or self._filepathway_cache[0] != filename:
+            self._filepathway_cache = (filename, str(Path(filename).resolve()))
+        return self._filepathway_cache[1]
+
+
+    @property
+    def coor(self):
+        """Return (3, N) array of atom coordinates
+
+        The coordinates are cached. Moving atoms directly on the underlying
+        gemmi objects, instead of through the methods of this class,
+        requires a call to _reset_cache() afterwards.
+        """
+        return self.__get_coor().copy()
+
+
+    @coor.setter
+    def coor(self, coor):
+        coor = np.array(coor, dtype=np.float64)
+        assert coor.shape == self.__get_coor().shape
+        for atom, pos in zip(self.__get_atoms(), coor.T):
+            atom.pos = gemmi.Position(*pos)
+        self._coor_cache = coor
+
+
+    @property
+    def bfacs(self):
+        """Return array of B-factors"""
+        return np.fromiter(
+            (atom.b_iso for atom in self.__get_atoms()),
+            dtype=np.float64, count=self._atom_count
+            )
+
+
+    @bfacs.setter
+    def bfacs(self, new_bfacs):
+        svpStructure.bfacs.fset(self, new_bfacs)
+
+
+    @property
+    def sequence(self):
+        """Return array of the element names of the atoms"""
+        return np.fromiter(
+            (atom.element.name for atom in self.__get_atoms()),
+            dtype='U2', count=self._atom_count
+            )
+
+
+    @property
+    def _atom_count(self):
+        return sum(model.count_atom_sites() for model in self.structure)
+
+
+    """Private method to get the cached coordinates without copying"""
+    def __get_coor(self):
+        natoms = self._atom_count
+        # Atoms added or removed through the gemmi structure change the count
+        if self._coor_cache is None or self._coor_cache.shape[1] != natoms:
+            xyz = np.fromiter(
+                itertools.chain.from_iterable(
+                    atom.pos.tolist() for atom in self.__get_atoms()
+                    ),
+                dtype=np.float64, count=3 * natoms
+                )
+            self._coor_cache = np.ascontiguousarray(xyz.reshape(natoms, 3).T)
+        return self._coor_cache
+
+
+    def translate(self, vector):
+        vector = np.asarray(vector, dtype=np.float64)
+        assert vector.shape == (3,)
+        coor = self.__get_coor()
+        # gemmi.Mat33() is the identity, so only the translation is applied
+        transform = gemmi.Transform(gemmi.Mat33(), gemmi.Vec3(*vector))
+        for model in self.structure:
+            model.transform_pos_and_adp(transform)
+        coor += vector.reshape(3, 1)
+
+
+    def rotate(self, rotation_matrix):
+        # Rotating around the centre of mass and translating back by the
+        # rotated centre of mass is the same as rotating around the origin.
+        self.affine(rotation_matrix, np.zeros(3))
+
+
+    def affine(self, rotation_matrix, vector):
+        """Rotate the structure around the origin and then translate it
+
+        The cached coordinates are updated with one matrix product and the
+        gemmi atoms are transformed in a single pass on the C++ side.
+        """
+        rotation_matrix = np.asarray(rotation_matrix, dtype=np.float64)
+        vector = np.asarray(vector, dtype=np.float64)
+        assert rotation_matrix.shape == (3, 3)
+        assert vector.shape == (3,)
+        coor = np.dot(rotation_matrix, self.__get_coor())
+        coor += vector.reshape(3, 1)
+        transform = gemmi.Transform(
+            gemmi.Mat33(rotation_matrix.tolist()), gemmi.Vec3(*vector)
+            )
+        for model in self.structure:
+            model.transform_pos_and_adp(transform)
+        self._coor_cache = coor
+
+
+    def rmsd(self, structure):
+        """Return the root-mean-square deviation to another structure"""
+        # structure.coor is a fresh array, so it doubles as scratch space
+        diff = structure.coor
+        coor = self.__get_coor()
+        assert coor.shape == diff.shape
+        np.subtract(coor, diff, out=diff)
+        np.square(diff, out=diff)
+        return np.sqrt(diff.mean() * 3)
+
+
+    def add_model(self, model):
+        super().add_model(model)
+        self._reset_cache()
+
+
+    def add_chain(self, chain, model_idx=0, **kwargs):
+        super().add_chain(chain, model_idx=model_idx, **kwargs)
+        self._reset_cache()
+
+
+    def _reset_cache(self):
+        # (3, N) coordinate array, built on first access and kept in sync
+        # with the gemmi atoms by the methods above.
+        self._coor_cache = None
+        # Unique element names and the inverse index into them, and the
+        # per-element property values looked up from ELEMENTS.
+        self._element_cache = None
+        self._property_cache = {}
+
 
     """Private method to get a property of the atoms in the structure"""
     def __get_property(self, ptype):
-        elements, ind = np.unique(
-            [atom.element.name for atom in self.__get_atoms()], return_inverse=True
-            )
-        return np.asarray([getattr(ELEMENTS[capwords(e)], ptype) 
-            for e in elements], dtype=np.float64)[ind]
+        # Atoms added or removed through the gemmi structure change the count
+        if (self._element_cache is None
+                or self._element_cache[1].size != self._atom_count):
+            self._element_cache = np.unique(self.sequence, return_inverse=True)
+            self._property_cache = {}
+        elements, ind = self._element_cache
+        if ptype not in self._property_cache:
+            index = ELEMENT_PROPERTIES.index(ptype)
+            self._property_cache[ptype] = np.fromiter(
+                (ELEMENT_TABLE[e.upper()][index] for e in elements),
+                dtype=np.float64, count=elements.size
+                )
+        return self._property_cache[ptype][ind]
     
 
     @property
@@ -1,4 +1,3 @@
-from __future__ import absolute_import
 import unittest
 
 if __name__ == '__main__':
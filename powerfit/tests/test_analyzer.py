@@ -0,0 +1,45 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from powerfit.analyzer import Analyzer
+
+
+class TestAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.analyzer = Analyzer(
+            np.zeros((2, 2, 2)), np.identity(3).reshape(1, 3, 3), np.zeros((2, 2, 2))
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_to_file(self):
+        self.analyzer._solutions = [
+            [0.812, 1.1324, 3.5, 10.0, -2.25, 123.456, 1, 0, 0, 0, 1, 0, 0, 0, 1],
+            [float('nan'), -0.0, 0.0, -1234.5678, 0.25, -0.0,
+                -1, 0, 0, 0, -1, 0, 0, 0, 1],
+            ]
+        out = os.path.join(self.tmpdir, 'solutions.out')
+        self.analyzer.to_file(out)
+        with open(out) as f:
+            lines = f.read().splitlines()
+
+        answer = [
+            '#rank      cc Fish-z  rel-z        x        y        z    a11    a12'
+            '    a13    a21    a22    a23    a31    a32    a33',
+            '1       0.812  1.132  3.500   10.000   -2.250  123.456  1.000  0.000'
+            '  0.000  0.000  1.000  0.000  0.000  0.000  1.000',
+            '2         nan -0.000  0.000 -1234.568    0.250   -0.000 -1.000  0.000'
+            '  0.000  0.000 -1.000  0.000  0.000  0.000  1.000',
+            ]
+        self.assertEqual(lines, answer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,3 @@
-from __future__ import absolute_import
 from unittest import TestCase, main
 
 import numpy as np
@@ -0,0 +1,129 @@
+import unittest
+from pathlib import Path
+
+import gemmi
+import numpy as np
+
+from powerfit.structure_helpers import Structure
+
+
+PDB = """\
+ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00 10.00           N
+ATOM      2  CA  ALA A   1      11.639   6.071  -5.147  1.00 11.00           C
+ATOM      3  C   ALA A   1      13.149   6.168  -5.134  1.00 12.00           C
+ATOM      4  O   ALA A   1      13.761   6.975  -5.838  1.00 13.00           O
+ATOM      5  CB  ALA A   1      11.126   7.162  -4.229  1.00 14.00           C
+ATOM      6  N   CYS A   2      13.749   5.330  -4.294  1.00 15.00           N
+ATOM      7  CA  CYS A   2      15.197   5.301  -4.170  1.00 16.00           C
+ATOM      8  SG  CYS A   2      16.000   4.000  -3.000  1.00 17.00           S
+END
+"""
+
+
+def gemmi_coor(structure):
+    return np.asarray([atom.pos.tolist() for atom in structure.atoms]).T
+
+
+class TestStructure(unittest.TestCase):
+
+    def setUp(self):
+        self.structure = Structure('test.pdb', gemmi.read_pdb_string(PDB))
+
+    def test_filepathway(self):
+        answer = str(Path('test.pdb').resolve())
+        self.assertEqual(self.structure.filepathway, answer)
+        self.assertEqual(self.structure.filepathway, answer)
+
+    def test_coor(self):
+        coor = self.structure.coor
+        self.assertEqual(coor.shape, (3, 8))
+        self.assertTrue(np.allclose(coor[:, 0], [11.104, 6.134, -6.504]))
+        # modifying the returned array does not change the structure
+        coor += 1
+        self.assertTrue(np.allclose(self.structure.coor, gemmi_coor(self.structure)))
+
+    def test_bfacs(self):
+        self.assertTrue(np.allclose(self.structure.bfacs, np.arange(10, 18)))
+        self.structure.bfacs = np.arange(8, dtype=np.float64)
+        self.assertTrue(np.allclose(self.structure.bfacs, np.arange(8)))
+
+    def test_sequence(self):
+        answer = ['N', 'C', 'C', 'O', 'C', 'N', 'C', 'S']
+        self.assertEqual(self.structure.sequence.tolist(), answer)
+
+    def test_properties(self):
+        answer = [7, 6, 6, 8, 6, 7, 6, 16]
+        self.assertTrue(np.allclose(self.structure.atomnumber, answer))
+        # values are cached, but the returned arrays are not shared
+        rvdw = self.structure.rvdw
+        rvdw /= 2
+        self.assertTrue(np.allclose(self.structure.rvdw, 2 * rvdw))
+
+        combined = self.structure.combine(self.structure)
+        self.assertEqual(combined.mass.shape, (16,))
+        self.assertEqual(self.structure.mass.shape, (8,))
+
+    def test_gemmi_edit(self):
+        self.structure.coor
+        self.structure.mass
+        # remove the CB atom, a carbon
+        del self.structure.structure[0]['A'][0][4]
+        self.assertEqual(self.structure.coor.shape, (3, 7))
+        self.assertEqual(self.structure.mass.shape, (7,))
+        self.assertEqual(self.structure.rvdw.shape, (7,))
+        self.assertEqual(self.structure.bfacs.shape, (7,))
+        self.assertTrue(np.allclose(self.structure.coor, gemmi_coor(self.structure)))
+
+    def test_translate(self):
+        coor = self.structure.coor
+        self.structure.translate([1, 2, 3])
+        answer = coor + np.asarray([1, 2, 3]).reshape(3, 1)
+        self.assertTrue(np.allclose(self.structure.coor, answer))
+        self.assertTrue(np.allclose(gemmi_coor(self.structure), answer))
+
+    def test_rotate(self):
+        coor = self.structure.coor
+        rotmat = np.asarray([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.float64)
+        self.structure.rotate(rotmat)
+        answer = np.dot(rotmat, coor)
+        self.assertTrue(np.allclose(self.structure.coor, answer))
+        self.assertTrue(np.allclose(gemmi_coor(self.structure), answer))
+
+    def test_rotate_aniso(self):
+        atom = self.structure.structure[0]['A'][0][0]
+        atom.aniso = gemmi.SMat33f(0.1, 0.2, 0.3, 0.01, 0.02, 0.03)
+        u = np.asarray(atom.aniso.as_mat33().tolist())
+        rotmat = np.asarray([[0, -1, 0], [1, 0, 0], [0, 0, 1]], dtype=np.float64)
+        self.structure.rotate(rotmat)
+        # ADPs are rotated along with the positions: U' = R U R^T
+        answer = np.dot(rotmat, np.dot(u, rotmat.T))
+        self.assertTrue(np.allclose(atom.aniso.as_mat33().tolist(), answer))
+        # a translation leaves them unchanged
+        self.structure.translate([1, 2, 3])
+        self.assertTrue(np.allclose(atom.aniso.as_mat33().tolist(), answer))
+
+    def test_affine(self):
+        coor = self.structure.coor
+        rotmat = np.asarray([[0, 0, 1], [0, 1, 0], [-1, 0, 0]], dtype=np.float64)
+        self.structure.affine(rotmat, [1, 2, 3])
+        answer = np.dot(rotmat, coor) + np.asarray([1, 2, 3]).reshape(3, 1)
+        self.assertTrue(np.allclose(self.structure.coor, answer))
+        self.assertTrue(np.allclose(gemmi_coor(self.structure), answer))
+
+    def test_rmsd(self):
+        duplicate = self.structure.duplicate()
+        self.assertAlmostEqual(self.structure.rmsd(duplicate), 0)
+        duplicate.translate([1, 2, 2])
+        self.assertAlmostEqual(self.structure.rmsd(duplicate), 3)
+        self.assertAlmostEqual(duplicate.rmsd(self.structure), 3)
+
+    def test_duplicate(self):
+        coor = self.structure.coor
+        duplicate = self.structure.duplicate()
+        duplicate.translate([1, 0, 0])
+        self.assertTrue(np.allclose(self.structure.coor, coor))
+        self.assertTrue(np.allclose(gemmi_coor(self.structure), coor))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,15 +8,11 @@
 
 # For more information about the original code, please see https://github.com/haddocking/powerfit. 
 
-from __future__ import division, absolute_import
-
 import warnings
 import numpy as np
 
 from scipy.ndimage import zoom, gaussian_filter
 from ._powerfit import blur_points, dilate_points
-from six.moves import range
-from six.moves import zip
 from struvolpy import Volume
 
 """Builders"""
@@ -1,5 +1,3 @@
-from __future__ import absolute_import
-from __future__ import print_function
 import sys
 
 import numpy as np
@@ -7,7 +5,6 @@ from numpy.fft import fftn
 
 from powerfit import Volume
 from powerfit._powerfit import fsc_curve
-from six.moves import range
 
 vol1 = Volume.from_file(sys.argv[1])
 vol2 = Volume.from_file(sys.argv[2])
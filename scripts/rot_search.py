@@ -1,6 +1,3 @@
-from __future__ import division
-from __future__ import absolute_import
-from __future__ import print_function
 from argparse import ArgumentParser, FileType
 from time import time
 import os
@@ -12,7 +9,6 @@ from powerfit import Structure, quat_to_rotmat, proportional_orientations, deter
 from struvolpy import Volume
 from powerfit._powerfit import rotate_grid
 from powerfit.volume import zeros_like, structure_to_shape
-from six.moves import range
 
 
 def parse_args():